@@ -16,38 +16,64 @@ Key differences to the cookie-based organiser:
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
+import json
 import logging
 import os
 import re
 import sys
 import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
-import mutagen
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3, COMM, TALB, TCON, TDRC, TIT2, TPE1, TPE2, TRCK, USLT, APIC, WOAF
-from mutagen.id3._specs import ID3TimeStamp, PictureType
-from mutagen.easyid3 import EasyID3
-from yandex_music import Client, DownloadInfo, Playlist, Track, YandexMusicModel, Album
+from yandex_music import Album, Client
+from yandex_music.exceptions import (
+    BadRequestError,
+    NetworkError,
+    NotFoundError,
+    TimedOutError,
+    UnauthorizedError,
+    YandexMusicError,
+)
+from yandex_music.utils.request import USER_AGENT, Request, default_timeout
+
+if TYPE_CHECKING:
+    from yandex_music import DownloadInfo, Playlist, Track, YandexMusicModel
+
+try:
+    from PIL import Image
+except ImportError:  # cover downscaling is optional
+    Image = None
 
 
 
-MAGIC_BYTES = (
-    ("image/jpeg", bytes((0xFF, 0xD8, 0xFF))),
-    ("image/png", bytes((0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A))),
+_JPEG_MAGIC = bytes((0xFF, 0xD8, 0xFF))
+_PNG_MAGIC = bytes((0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A))
+_RIFF_MAGIC = b"RIFF"
+_WEBP_MAGIC = b"WEBP"  # at offset 8, inside the RIFF container
+#: ISO-BMFF brands (at offset 4) mapped to their MIME types.
+_FTYP_BRANDS = (
+    (b"ftypavif", "image/avif"),
+    (b"ftypheic", "image/heif"),
+    (b"ftypheix", "image/heif"),
+    (b"ftypmif1", "image/heif"),
 )
 
 
 def get_image_type(data: bytes) -> str:
     """Return MIME type for *data* based on magic bytes.
 
-    The function currently recognises JPEG and PNG headers and returns a
-    string suitable for the ``mime`` field of an ID3 *APIC* frame.  When
-    the header is not recognised the function falls back to
+    The function recognises JPEG, PNG, WebP, AVIF and HEIC/HEIF headers
+    and returns a string suitable for the ``mime`` field of an ID3 *APIC*
+    frame.  When the header is not recognised the function falls back to
     ``"image/jpeg"`` because most players will still understand it.
 
     Parameters
@@ -58,12 +84,15 @@ def get_image_type(data: bytes) -> str:
     Returns
     -------
     str
-        ``"image/jpeg"`` or ``"image/png"``.
+        MIME type such as ``"image/jpeg"`` or ``"image/webp"``.
     """
-    for mime_type, magic_bytes in MAGIC_BYTES:
-        if data.startswith(magic_bytes):
+    if data.startswith(_PNG_MAGIC):
+        return "image/png"
+    if data.startswith(_RIFF_MAGIC) and data[8:12] == _WEBP_MAGIC:
+        return "image/webp"
+    for brand, mime_type in _FTYP_BRANDS:
+        if data[4:12] == brand:
             return mime_type
-    
     return "image/jpeg"
 
 # ---------------------------------------------------------------------------
@@ -72,6 +101,33 @@ def get_image_type(data: bytes) -> str:
 
 FILENAME_RE = re.compile(r"^(\d+).\s*(.+?)\s-\s*(.*?).mp3$", re.IGNORECASE)
 
+#: Upper bound on tracks downloaded/tagged concurrently (per host politeness cap).
+MAX_CONCURRENT_DOWNLOADS = 8
+
+#: Chunk/buffer size for streaming the MP3 body to disk.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+#: How many track ids to request per bulk `Client.tracks` call.
+TRACKS_BATCH_SIZE = 100
+
+#: Default request rate against the download hosts when the server does not
+#: advertise its own limits.
+DOWNLOAD_RPS = 4.0
+
+#: Ceiling on any server-advertised backoff, so a malformed or
+#: absolute-timestamp header can never stall the run indefinitely.
+MAX_BACKOFF_SECONDS = 60.0
+
+#: Sidecar file caching the library scan between runs.
+INDEX_FILENAME = ".index.json"
+
+#: Server-side cover variant requested instead of the multi-megabyte "orig".
+COVER_FETCH_SIZE = "400x400"
+
+#: Longest edge / JPEG quality used when re-encoding covers before embedding.
+COVER_MAX_EDGE = 600
+COVER_JPEG_QUALITY = 85
+
 logger = logging.getLogger("ym_organizer_api")
 logging.basicConfig(
     level=logging.INFO,
@@ -111,24 +167,89 @@ def parse_playlist_url(url: str) -> Tuple[str, int]:
     return owner, int(kind_str)
 
 
+#: Translation table mapping illegal filename characters to hyphens.
+_BAD_FILENAME_CHARS = {ord(c): "-" for c in '\\/:*?"<>|'}
+
+
 def sanitize_component(text: str) -> str:
     """Replace illegal filename characters with hyphen."""
-    return re.sub(r"[\\/:*?\"<>|]+", "-", text.strip())
+    return text.strip().translate(_BAD_FILENAME_CHARS)
 
 
-def get_highest_local_id(target_dir: Path) -> int:
-    """Return the largest numeric ID already present in *target_dir*."""
-    if not target_dir.exists():
-        return 0
+def scan_local_library(target_dir: Path) -> Tuple[int, set]:
+    """Return ``(max_id, identifiers)`` for the collection in *target_dir*.
+
+    A single ``os.scandir`` pass matches :data:`FILENAME_RE` against the
+    raw entry names only, so no per-entry ``stat`` calls are issued.
+    """
     max_id = 0
-    for file in target_dir.glob("*.mp3"):
-        m = FILENAME_RE.match(file.name)
-        if m:
-            try:
-                max_id = max(max_id, int(m.group(1)))
-            except ValueError:
-                pass
-    return max_id
+    identifiers: set = set()
+    if not target_dir.exists():
+        return max_id, identifiers
+    _match = FILENAME_RE.match
+    with os.scandir(target_dir) as it:
+        for entry in it:
+            m = _match(entry.name)
+            if not m:
+                continue
+            max_id = max(max_id, int(m.group(1)))
+            identifiers.add(f"{m.group(2)}-{m.group(3)}".lower())
+    return max_id, identifiers
+
+
+def fetch_full_tracks(client: Client, ids: List[str]) -> List[Track]:
+    """Fetch full :class:`Track` objects for the given track *ids*.
+
+    Uses the bulk ``Client.tracks`` endpoint in chunks of
+    :data:`TRACKS_BATCH_SIZE` instead of one round-trip per
+    :class:`TrackShort`, preserving input order.
+    """
+    full_tracks: List[Track] = []
+    for start in range(0, len(ids), TRACKS_BATCH_SIZE):
+        full_tracks.extend(client.tracks(ids[start : start + TRACKS_BATCH_SIZE]))
+    return full_tracks
+
+
+def save_library_index(target_dir: Path, max_id: int, identifiers: set) -> None:
+    """Persist the library scan to ``target_dir/.index.json``.
+
+    The directory mtime is recorded *after* the index entry exists so a
+    freshly created sidecar does not invalidate itself on the next run.
+    """
+    if not target_dir.exists():
+        return
+    index_path = target_dir / INDEX_FILENAME
+    try:
+        index_path.touch(exist_ok=True)
+        payload = {
+            "dir_mtime": target_dir.stat().st_mtime,
+            "max_id": max_id,
+            "identifiers": sorted(identifiers),
+        }
+        index_path.write_text(json.dumps(payload))
+    except OSError as exc:
+        logger.warning("Could not write library index: %s", exc)
+
+
+def load_library_index(target_dir: Path) -> Tuple[int, set]:
+    """Return ``(max_id, identifiers)``, served from the sidecar when fresh.
+
+    The cached scan in ``.index.json`` is used as long as the directory
+    mtime matches the recorded one; any addition or removal of files bumps
+    the mtime and triggers a full :pyfunc:`scan_local_library` rescan,
+    after which the sidecar is rewritten.
+    """
+    index_path = target_dir / INDEX_FILENAME
+    if index_path.exists():
+        try:
+            data = json.loads(index_path.read_text())
+            if data.get("dir_mtime") == target_dir.stat().st_mtime:
+                return int(data["max_id"]), set(data["identifiers"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable library index: %s", exc)
+    max_id, identifiers = scan_local_library(target_dir)
+    save_library_index(target_dir, max_id, identifiers)
+    return max_id, identifiers
 
 
 def build_track_identifier(track: Track) -> str:
@@ -154,15 +275,180 @@ def choose_best_download_info(infos: List[DownloadInfo]) -> DownloadInfo:
     return max(mp3_infos, key=lambda i: i.bitrate_in_kbps)
 
 
-def download_track(track: Track, dest: Path) -> Path | None:
-    """Download *track* to *dest* (directory) and return resulting path or None."""
+class KeepAliveRequest(Request):
+    """:class:`yandex_music.utils.request.Request` routed through one session.
+
+    The stock implementation calls :pyfunc:`requests.request`, which opens a
+    fresh TCP+TLS connection for every API call (download info, covers,
+    lyrics).  This variant reuses a pooled keep-alive
+    :class:`requests.Session` so the handshake cost is paid once per host.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def _request_wrapper(self, *args, **kwargs) -> bytes:
+        """Same contract as the base wrapper, but using the shared session."""
+        if "headers" not in kwargs:
+            kwargs["headers"] = {}
+
+        kwargs["headers"]["User-Agent"] = USER_AGENT
+
+        if kwargs["timeout"] is default_timeout:
+            kwargs["timeout"] = self._timeout
+
+        try:
+            resp = self._session.request(*args, **kwargs)
+        except requests.Timeout as e:
+            raise TimedOutError from e
+        except requests.RequestException as e:
+            raise NetworkError(e) from e
+
+        if 200 <= resp.status_code <= 299:
+            return resp.content
+
+        message = "Unknown error"
+        try:
+            parse = self._parse(resp.content)
+            if parse:
+                message = parse.get_error()
+        except YandexMusicError:
+            message = "Unknown HTTPError"
+
+        if resp.status_code in (401, 403):
+            raise UnauthorizedError(message)
+        if resp.status_code == 400:
+            raise BadRequestError(message)
+        if resp.status_code == 404:
+            raise NotFoundError(message)
+        if resp.status_code in (409, 413):
+            raise NetworkError(message)
+
+        if resp.status_code == 502:
+            raise NetworkError("Bad Gateway")
+
+        raise NetworkError(f"{message} ({resp.status_code}): {resp.content}")
+
+    def retrieve_conditional(self, url: str, etag: str | None) -> Tuple[bytes | None, str | None]:
+        """GET *url* with ``If-None-Match: etag`` and return ``(content, etag)``.
+
+        On a 304 Not Modified the content is ``None`` and the caller should
+        reuse its cached copy.
+        """
+        headers = {"User-Agent": USER_AGENT}
+        if etag:
+            headers["If-None-Match"] = etag
+        resp = self._session.get(url, headers=headers, timeout=self._timeout)
+        if resp.status_code == 304:
+            return None, etag
+        resp.raise_for_status()
+        return resp.content, resp.headers.get("ETag")
+
+
+class RateLimiter:
+    """Adaptive token-bucket limiter for the download HTTP calls.
+
+    Spaces request starts to at most *rps* per second and, when a response
+    carries ``Retry-After`` or ``X-RateLimit-*`` headers, defers the next
+    acquisition until the advertised reset instead of sleeping a fixed
+    amount between tracks.
+    """
+
+    def __init__(self, rps: float = DOWNLOAD_RPS) -> None:
+        self._interval = 1.0 / rps
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(self._next_start, now)
+            self._next_start = start + self._interval
+        if (delay := start - now) > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers: "aiohttp.typedefs.LooseHeaders") -> None:
+        """Feed response *headers* back into the limiter.
+
+        Any advertised backoff is clamped to :data:`MAX_BACKOFF_SECONDS`.
+        """
+        delay = None
+        if retry_after := headers.get("Retry-After"):
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # HTTP-date form; honour the backoff request with the
+                # ceiling delay rather than dropping it.
+                delay = MAX_BACKOFF_SECONDS
+        elif (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+            try:
+                if int(remaining) < 1 and (reset := headers.get("X-RateLimit-Reset")):
+                    delay = float(reset)
+                    if delay > 1e8:  # absolute epoch timestamp, not seconds-from-now
+                        delay -= time.time()
+            except ValueError:
+                pass
+        if delay and (delay := min(delay, MAX_BACKOFF_SECONDS)) > 0:
+            self._next_start = max(self._next_start, time.monotonic() + delay)
+
+
+def _shrink_cover(data: bytes, max_edge: int = COVER_MAX_EDGE, quality: int = COVER_JPEG_QUALITY) -> bytes:
+    """Downscale cover *data* to *max_edge* px and re-encode as JPEG.
+
+    Keeps the APIC payload small so later tag rewrites never have to
+    relocate the audio data.  When Pillow is not installed or the image
+    cannot be decoded the original bytes are returned unchanged.
+    """
+    if Image is None:
+        return data
     try:
-        infos = track.get_download_info()
+        with Image.open(io.BytesIO(data)) as img:
+            if max(img.size) <= max_edge and img.format == "JPEG":
+                return data
+            img.thumbnail((max_edge, max_edge))
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, format="JPEG", quality=quality, optimize=True)
+            return buf.getvalue()
+    except Exception as exc:
+        logger.warning("Could not shrink cover art: %s", exc)
+        return data
+
+
+def build_final_name(track: Track, id: int) -> str:
+    """Return the collection filename '<id>. <artist> - <title>.mp3' for *track*."""
+    artist = sanitize_component(track.artists[0].name if track.artists else "")
+    title = sanitize_component(track.title)
+    return f"{id:04d}. {artist} - {title}.mp3"
+
+
+async def download_track(
+    track: Track, session: aiohttp.ClientSession, limiter: RateLimiter
+) -> io.BytesIO | None:
+    """Download the MP3 body of *track* into memory and return the buffer.
+
+    The download-info resolution still goes through the synchronous client
+    (executed in a worker thread), while the actual MP3 body is streamed
+    through the shared aiohttp *session*.  Keeping the bytes in memory lets
+    the ID3 tag be written into the same buffer, so the final file is
+    written to disk exactly once.
+    """
+    try:
+        infos = await asyncio.to_thread(track.get_download_info)
         best = choose_best_download_info(infos)
-        dest.mkdir(parents=True, exist_ok=True)
-        tmp_path = dest / "temp_download.mp3"
-        best.download(str(tmp_path))
-        return tmp_path
+        direct_link = await asyncio.to_thread(best.get_direct_link)
+        buf = io.BytesIO()
+        await limiter.acquire()
+        async with session.get(direct_link) as resp:
+            limiter.update(resp.headers)
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                buf.write(chunk)
+        return buf
     except Exception as exc:  # broad but easier for cli tool
         logger.error("Failed to download track %s: %s", track.id, exc)
         return None
@@ -178,29 +464,110 @@ def full_title(obj: YandexMusicModel) -> str:
     return result
 
 
-def set_tags(path: Path, track: Track, id: int):
-    """Populate ID3 tags for *track* stored at *path*.
+def fetch_lyrics_text(track: Track) -> str | None:
+    """Fetch full text lyrics for *track*, or None when unavailable."""
+    if track.lyrics_info is None or not track.lyrics_info.has_available_text_lyrics:
+        return None
+    if track_lyrics := track.get_lyrics(format_="TEXT"):
+        return track_lyrics.fetch_lyrics()
+    return None
+
+
+def fetch_cover_bytes(
+    track: Track, cached_etag: str | None = None, cached_cover: bytes | None = None
+) -> Tuple[bytes | None, str | None]:
+    """Fetch and downscale cover art for *track*, returning ``(bytes, etag)``.
+
+    When a *cached_etag* recovered from an earlier tagged copy is supplied
+    the request goes out conditionally (``If-None-Match``) and a 304 reply
+    short-circuits to *cached_cover* without transferring the payload.
+    """
+    if track.cover_uri is None:
+        return None, None
+    request = track.client.request if track.client else None
+    if isinstance(request, KeepAliveRequest):
+        cover_url = f"https://{track.cover_uri.replace('%%', COVER_FETCH_SIZE)}"
+        data, etag = request.retrieve_conditional(cover_url, cached_etag)
+        if data is None:
+            return cached_cover, etag
+        return _shrink_cover(data), etag
+    return _shrink_cover(track.download_cover_bytes(size=COVER_FETCH_SIZE)), None
+
+
+def load_cached_tag_payloads(final_path: Path) -> Tuple[str | None, bytes | None, str | None]:
+    """Recover ``(cover_etag, cover_bytes, lyrics_text)`` from an earlier copy.
+
+    When *final_path* already holds a tagged MP3 from an interrupted run,
+    its APIC frame (ETag in the description) and USLT frame (validated by
+    the ``TXXX:LyricsHash`` marker) let the rerun skip re-downloading the
+    binary payloads.  Returns all-``None`` when nothing usable is cached.
+    """
+    if not final_path.exists():
+        return None, None, None
+    from mutagen.id3 import ID3
+
+    try:
+        tag = ID3(final_path)
+    except Exception:
+        return None, None, None
+    cover_etag = cover_bytes = lyrics_text = None
+    if apics := tag.getall("APIC"):
+        if apics[0].desc:
+            cover_etag, cover_bytes = apics[0].desc, bytes(apics[0].data)
+    if (uslts := tag.getall("USLT")) and (hashes := tag.getall("TXXX:LyricsHash")):
+        text = str(uslts[0].text)
+        if str(hashes[0].text[0]) == hashlib.sha1(text.encode()).hexdigest():
+            lyrics_text = text
+    return cover_etag, cover_bytes, lyrics_text
+
+
+def set_tags(
+    buf: io.BytesIO,
+    track: Track,
+    id: int,
+    cover_bytes: bytes | None,
+    lyrics_text: str | None,
+    cover_etag: str | None = None,
+):
+    """Write ID3 tags for *track* into the in-memory MP3 *buf*.
 
     Besides the standard frames (title, album, artists, year, track
     number) the function embeds:
 
     * complete synced/unsynced lyrics when available,
-    * the original cover art in full resolution,
+    * the (downscaled) cover art,
     * ``WOAF`` frame with a canonical web link to the track.
 
+    The network-bound payloads are passed in pre-fetched (*cover_bytes*,
+    *lyrics_text*) so they can be downloaded concurrently with the MP3
+    body; the tag is assembled and saved entirely in memory so the track
+    hits the disk only once, fully tagged.
+
     Parameters
     ----------
-    path: pathlib.Path
-        Path to the freshly downloaded MP3 file.
+    buf: io.BytesIO
+        Buffer holding the freshly downloaded MP3 body.
     track: yandex_music.Track
         Full track object with metadata.
     id: int
         Sequential numeric identifier used in the filename.
+    cover_bytes: bytes | None
+        Cover art returned by :pyfunc:`fetch_cover_bytes`.
+    lyrics_text: str | None
+        Lyrics returned by :pyfunc:`fetch_lyrics_text`.
+    cover_etag: str | None
+        ETag of the cover response; stored in the APIC description so
+        later runs can revalidate with ``If-None-Match``.
     """
+    # mutagen is imported lazily so runs that exit early (missing config,
+    # no new tracks) never pay its import cost.
+    from mutagen.id3 import APIC, ID3, TALB, TDRC, TIT2, TPE1, TPE2, TRCK, TXXX, USLT, WOAF
+    from mutagen.id3._specs import ID3TimeStamp
+
     album = track.albums[0] if track.albums else Album()
     track_artists = [a.name for a in track.artists if a.name]
     album_artists = [a.name for a in album.artists if a.name]
-    tag = MP3(path)
+    tag = ID3()
     album_title = full_title(album)
     track_title = full_title(track)
     iso8601_release_date = None
@@ -225,26 +592,91 @@ def set_tags(path: Path, track: Track, id: int):
     if id:
         tag["TRCK"] = TRCK(encoding=3, text=str(id))
     
-    if track.lyrics_info != None and track.lyrics_info.has_available_text_lyrics:
-        if track_lyrics := track.get_lyrics(format_="TEXT"):
-            text_lyrics = track_lyrics.fetch_lyrics()
-            tag["USLT"] = USLT(encoding=3, text=text_lyrics)
+    if lyrics_text is not None:
+        tag["USLT"] = USLT(encoding=3, text=lyrics_text)
+        tag["TXXX:LyricsHash"] = TXXX(
+            encoding=3, desc="LyricsHash", text=hashlib.sha1(lyrics_text.encode()).hexdigest()
+        )
 
-    if track.cover_uri is not None:
-        cover_bytes = track.download_cover_bytes(size="orig")
+    if cover_bytes is not None:
         mime_type = get_image_type(cover_bytes)
         if mime_type is not None:
             tag["APIC"] = APIC(
             encoding=3,
             mime=mime_type,
             type=3,
-            data=cover_bytes)        
+            desc=cover_etag or "",
+            data=cover_bytes)
 
     tag["WOAF"] = WOAF(
         encoding=3,
         text=track_url)
 
-    tag.save()
+    buf.seek(0)
+    tag.save(buf, v2_version=4)
+
+
+def write_track(buf: io.BytesIO, final_path: Path) -> None:
+    """Flush the tagged in-memory MP3 *buf* to *final_path* in one buffered write."""
+    with open(final_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+        f.write(buf.getbuffer())
+
+
+async def _download_one(
+    track: Track,
+    id: int,
+    final_path: Path,
+    session: aiohttp.ClientSession,
+    sem: asyncio.BoundedSemaphore,
+    limiter: RateLimiter,
+) -> None:
+    """Download, tag and save a single *track* under the concurrency cap.
+
+    Failures are contained per track: anything raised by the cover/lyrics
+    fetches, the tag assembly or the final write is logged and skipped so
+    one bad track cannot cancel the rest of the batch.
+    """
+    async with sem:
+        try:
+            cached_etag, cached_cover, cached_lyrics = await asyncio.to_thread(
+                load_cached_tag_payloads, final_path
+            )
+
+            async def _lyrics() -> str | None:
+                if cached_lyrics is not None:
+                    return cached_lyrics
+                return await asyncio.to_thread(fetch_lyrics_text, track)
+
+            buf, (cover_bytes, cover_etag), lyrics_text = await asyncio.gather(
+                download_track(track, session, limiter),
+                asyncio.to_thread(fetch_cover_bytes, track, cached_etag, cached_cover),
+                _lyrics(),
+            )
+            if not buf:
+                return
+            await asyncio.to_thread(set_tags, buf, track, id, cover_bytes, lyrics_text, cover_etag)
+            await asyncio.to_thread(write_track, buf, final_path)
+            logger.info(f"Saved {final_path.name}")
+        except Exception as exc:  # broad but easier for cli tool
+            logger.error("Failed to process track %s: %s", track.id, exc)
+
+
+async def _download_all(new_tracks: List[Track], highest_id: int, target_dir: Path) -> None:
+    """Run the per-track pipeline for *new_tracks* concurrently."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    sem = asyncio.BoundedSemaphore(MAX_CONCURRENT_DOWNLOADS)
+    limiter = RateLimiter()
+    # Bound the pool behind asyncio.to_thread so the sync client calls and
+    # tag writes use at most as many threads as tracks in flight.
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS)
+    asyncio.get_running_loop().set_default_executor(executor)
+    async with aiohttp.ClientSession() as session:
+        tasks = []
+        for i, track in enumerate(new_tracks):
+            id = highest_id + 1 + i
+            final_path = target_dir / build_final_name(track, id)
+            tasks.append(_download_one(track, id, final_path, session, sem, limiter))
+        await asyncio.gather(*tasks)
 
 # ---------------------------------------------------------------------------
 # Main orchestration
@@ -255,37 +687,39 @@ def main() -> None:
     cfg = load_config()
     owner, kind = parse_playlist_url(cfg["PLAYLIST_URL"])
 
-    client = Client(token=cfg["API_KEY"]).init()
+    client = Client(token=cfg["API_KEY"], request=KeepAliveRequest()).init()
     playlist: Playlist = client.users_playlists(kind, owner)  # type: ignore[arg-type]
     logger.info("Fetched playlist '%s' (%d tracks)", playlist.title, len(playlist.tracks))
 
     # Build mapping of local collection
     target_dir = Path(cfg["TARGET_DIR"]).expanduser()
-    highest_id = get_highest_local_id(target_dir)
+    highest_id, existing_identifiers = load_library_index(target_dir)
     logger.info("Highest local id: %d", highest_id)
 
-    # Determine tracks to fetch (newest first)
-    existing_identifiers = set()
-    for file in target_dir.glob("*.mp3"):
-        m = FILENAME_RE.match(file.name)
-        if not m:
-            continue
-        identifier = f"{m.group(2)}-{m.group(3)}".lower()
-        existing_identifiers.add(identifier)
-
-    new_tracks: List[Track] = []
+    # Determine tracks to fetch (newest first).  The short-form track data
+    # embedded in the playlist is enough to recognise already present
+    # entries, so the bulk metadata fetch only covers actual candidates —
+    # on steady-state runs that is one or two tracks, not the whole head.
+    candidates = []
     for item in playlist.tracks:
         # each item is TrackShort
-        full = item.fetch_track()
-        ident = build_track_identifier(full)
-        if ident in existing_identifiers:
-            logger.info("Encountered already present track '%s' – stopping scan", ident)
+        if item.track is not None and build_track_identifier(item.track) in existing_identifiers:
+            logger.info("Encountered already present track – stopping scan")
             break
-        new_tracks.append(full)
-        if len(new_tracks) >= int(cfg["MAX_DOWNLOADS"]):
+        candidates.append(item)
+        if len(candidates) >= int(cfg["MAX_DOWNLOADS"]):
             logger.info("Maximum number of tracks to download reached.")
             break
 
+    new_tracks: List[Track] = []
+    if candidates:
+        for full in fetch_full_tracks(client, [item.track_id for item in candidates]):
+            ident = build_track_identifier(full)
+            if ident in existing_identifiers:
+                logger.info("Encountered already present track '%s' – stopping scan", ident)
+                break
+            new_tracks.append(full)
+
     if not new_tracks:
         logger.info("No new tracks to download.")
         return
@@ -294,24 +728,13 @@ def main() -> None:
 
     # Download and move with proper ids (oldest gets smallest new id)
     new_tracks.reverse()  # oldest first for id assignment
-    next_id = highest_id + 1
-    for track in new_tracks:
-        temp_path = download_track(track, target_dir)
-        if not temp_path:
-            continue
-        set_tags(temp_path, track, next_id)
-        artist = sanitize_component(track.artists[0].name if track.artists else "")
-        title = sanitize_component(track.title)
-        id_str = f"{next_id:04d}"
-        final_name = f"{id_str}. {artist} - {title}.mp3"
-        final_path = os.path.join(target_dir, final_name)
-        temp_path.replace(final_path)
-        logger.info(f"Saved {final_name}")
-        next_id += 1
-        # be polite
-        time.sleep(1)
-
-    logger.info("Done. Collection now contains %d items.", next_id - 1)
+    asyncio.run(_download_all(new_tracks, highest_id, target_dir))
+
+    # Refresh the sidecar from disk so failed downloads are not cached as present.
+    max_id, identifiers = scan_local_library(target_dir)
+    save_library_index(target_dir, max_id, identifiers)
+
+    logger.info("Done. Collection now contains %d items.", max_id)
 
 
 if __name__ == "__main__":